@@ -1,19 +1,57 @@
 """Example usage of the 3D provenance project.
 
-Demonstrates how to use the generator, renderer, and provenance tracker
+Demonstrates how to use the generator and provenance tracker
 programmatically (without the CLI).
 """
 
-import os
 import sys
 from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from src.generator import ObjectGenerator
 from src.provenance import ProvenanceTracker
-from src.renderer import MeshRenderer
+
+# (label, output name, export format, ObjectGenerator keyword arguments)
+DEFAULT_SHAPES: Tuple[Tuple[str, str, str, Dict[str, Any]], ...] = (
+    ("red sphere", "example_sphere", "ply",
+     {"shape": "sphere", "size": 1.0, "color": (255, 0, 0)}),
+    ("green cube", "example_cube", "obj",
+     {"shape": "cube", "size": 1.5, "color": (0, 255, 0)}),
+    ("blue cylinder", "example_cylinder", "stl",
+     {"shape": "cylinder", "size": 1.0, "color": (0, 0, 255)}),
+)
+
+
+def generate_example(
+    output_dir: Path,
+    shapes: Optional[Iterable[Tuple[str, str, str, Dict[str, Any]]]] = None,
+) -> List[Tuple[ObjectGenerator, str]]:
+    """Generate and export a set of example objects.
+
+    Each shape gets its own ObjectGenerator rather than going through
+    ``ObjectGenerator.build_batch``: that returns bare meshes, while exporting
+    needs the generator's ``export()``.
+
+    Args:
+        output_dir: Directory the models are written to.
+        shapes: (label, name, format, generator kwargs) tuples; defaults to
+            a red sphere, a green cube, and a blue cylinder.
+
+    Returns:
+        The generator and exported model path for each shape, in order.
+    """
+    results = []
+    for label, name, file_format, spec in DEFAULT_SHAPES if shapes is None else shapes:
+        print(f"Generating a {label}...")
+        generator = ObjectGenerator(**spec)
+        generator.generate()
+        path = generator.export(output_dir / name, file_format)
+        print(f"  Saved 3D model to: {path}")
+        results.append((generator, path))
+    return results
 
 
 def main() -> None:
@@ -21,26 +59,8 @@ def main() -> None:
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
 
-    # 1. Generate a red sphere
-    print("Generating a red sphere...")
-    sphere_gen = ObjectGenerator(shape="sphere", size=1.0, color=(255, 0, 0))
-    sphere_mesh = sphere_gen.generate()
-    sphere_path = sphere_gen.export(str(output_dir / "example_sphere"), "ply")
-    print(f"  Saved 3D model to: {sphere_path}")
-
-    # 2. Generate a green cube
-    print("Generating a green cube...")
-    cube_gen = ObjectGenerator(shape="cube", size=1.5, color=(0, 255, 0))
-    cube_mesh = cube_gen.generate()
-    cube_path = cube_gen.export(str(output_dir / "example_cube"), "obj")
-    print(f"  Saved 3D model to: {cube_path}")
-
-    # 3. Generate a blue cylinder
-    print("Generating a blue cylinder...")
-    cyl_gen = ObjectGenerator(shape="cylinder", size=1.0, color=(0, 0, 255))
-    cyl_mesh = cyl_gen.generate()
-    cyl_path = cyl_gen.export(str(output_dir / "example_cylinder"), "stl")
-    print(f"  Saved 3D model to: {cyl_path}")
+    # 1-3. Generate a red sphere, a green cube, and a blue cylinder
+    (sphere_gen, sphere_path), _, _ = generate_example(output_dir)
 
     # 4. Track provenance for the sphere
     print("\nCreating provenance record for the sphere...")
@@ -56,8 +76,8 @@ def main() -> None:
     tracker.record_attribution("sphere_model", "software")
 
     # 5. Export provenance
-    prov_json = tracker.export_json(str(output_dir / "example_provenance"))
-    prov_xml = tracker.export_xml(str(output_dir / "example_provenance"))
+    prov_json = tracker.export_json(output_dir / "example_provenance")
+    prov_xml = tracker.export_xml(output_dir / "example_provenance")
     print(f"  Provenance JSON: {prov_json}")
     print(f"  Provenance XML: {prov_xml}")
 
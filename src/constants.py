@@ -0,0 +1,9 @@
+"""Lightweight shared constants.
+
+Kept free of heavy imports (Open3D, NumPy) so the CLI can build its
+argument parser without loading the geometry and rendering stacks.
+"""
+
+SUPPORTED_SHAPES = ("sphere", "cube", "cylinder")
+SUPPORTED_FORMATS = ("ply", "obj", "stl")
+SUPPORTED_IMAGE_FORMATS = ("png", "jpg")
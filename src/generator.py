@@ -5,17 +5,222 @@ using Open3D, with support for customizable parameters, vertex colors, and
 export to PLY, OBJ, and STL formats.
 """
 
+import functools
 import logging
+import os
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import open3d as o3d
 
+from src.constants import SUPPORTED_FORMATS, SUPPORTED_SHAPES
+
 logger = logging.getLogger(__name__)
 
-SUPPORTED_SHAPES = ("sphere", "cube", "cylinder")
-SUPPORTED_FORMATS = ("ply", "obj", "stl")
+
+@functools.lru_cache(maxsize=64)
+def _cylinder_triangles(resolution: int) -> np.ndarray:
+    """Return the int32 triangle indices of a cylinder.
+
+    The topology depends only on the resolution, so it is built once into a
+    preallocated array and shared by every cylinder size. The cached array
+    must not be modified; Vector3iVector copies it into each mesh.
+
+    Args:
+        resolution: Number of segments around the circumference.
+
+    Returns:
+        Triangle index array of shape (4 * resolution, 3).
+    """
+    idx = np.arange(resolution, dtype=np.int32)
+    top = idx + 2
+    top_next = (idx + 1) % resolution + 2
+    bottom = top + resolution
+    bottom_next = top_next + resolution
+    triangles = np.empty((4, resolution, 3), dtype=np.int32)
+    triangles[0] = np.column_stack((np.zeros_like(idx), top, top_next))
+    triangles[1] = np.column_stack((np.ones_like(idx), bottom_next, bottom))
+    triangles[2] = np.column_stack((bottom, bottom_next, top_next))
+    triangles[3] = np.column_stack((bottom, top_next, top))
+    return triangles.reshape(-1, 3)
+
+
+def _build_cylinder_np(
+    radius: float, height: float, resolution: int
+) -> o3d.geometry.TriangleMesh:
+    """Build a closed cylinder along the z axis with vectorized NumPy.
+
+    Vertex layout is top center, bottom center, then the top ring followed
+    by the bottom ring, giving ``2 * resolution + 2`` vertices and
+    ``4 * resolution`` outward-facing triangles.
+
+    Args:
+        radius: Cylinder radius.
+        height: Cylinder height, centered on the origin.
+        resolution: Number of segments around the circumference.
+
+    Returns:
+        The cylinder mesh without normals or colors.
+    """
+    theta = np.linspace(0.0, 2.0 * np.pi, resolution, endpoint=False)
+    ring = np.column_stack(
+        (radius * np.cos(theta), radius * np.sin(theta), np.zeros(resolution))
+    )
+    half = height / 2.0
+    vertices = np.empty((2 * resolution + 2, 3), dtype=np.float64)
+    vertices[0] = (0.0, 0.0, half)
+    vertices[1] = (0.0, 0.0, -half)
+    vertices[2:resolution + 2] = ring
+    vertices[2:resolution + 2, 2] = half
+    vertices[resolution + 2:] = ring
+    vertices[resolution + 2:, 2] = -half
+
+    return o3d.geometry.TriangleMesh(
+        o3d.utility.Vector3dVector(vertices),
+        o3d.utility.Vector3iVector(_cylinder_triangles(resolution)),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _build_base_mesh(
+    shape: str, size: float, resolution: int, vertex_normals: bool
+) -> o3d.geometry.TriangleMesh:
+    """Build an uncolored template mesh with normals.
+
+    Results are cached per (shape, size, resolution, vertex_normals), so the
+    returned mesh is shared and must not be modified; callers work on a copy.
+
+    Args:
+        shape: Shape type - one of 'sphere', 'cube', 'cylinder'.
+        size: Scale factor for the generated object.
+        resolution: Tessellation resolution for curved surfaces.
+        vertex_normals: Compute smooth vertex normals (needed for shading);
+            otherwise only the per-face normals STL stores are computed.
+
+    Returns:
+        The cached template mesh.
+    """
+    if shape == "sphere":
+        mesh = o3d.geometry.TriangleMesh.create_sphere(
+            radius=size, resolution=resolution
+        )
+    elif shape == "cube":
+        mesh = o3d.geometry.TriangleMesh.create_box(
+            width=size, height=size, depth=size
+        )
+        # Center the cube at origin; np.asarray is a writable view of the
+        # vertex buffer, so the subtraction updates the mesh in place
+        vertices = np.asarray(mesh.vertices)
+        vertices -= size * 0.5
+    elif shape == "cylinder":
+        mesh = _build_cylinder_np(
+            radius=size / 2.0,
+            height=size,
+            resolution=resolution,
+        )
+
+    if vertex_normals:
+        mesh.compute_vertex_normals()
+    else:
+        mesh.compute_triangle_normals()
+    logger.debug("Built base %s mesh (size=%s, resolution=%s)", shape, size, resolution)
+    return mesh
+
+
+def _format_rows(row_format: str, rows: np.ndarray) -> str:
+    """Format every row of a 2D array with one %-formatting call."""
+    return (row_format * len(rows)) % tuple(rows.ravel().tolist())
+
+
+def _write_obj(output_path: Path, mesh: o3d.geometry.TriangleMesh) -> None:
+    """Write a mesh as Wavefront OBJ with a single file write.
+
+    Vertex colors are emitted as the common ``v x y z r g b`` extension and
+    vertex normals as ``vn`` records referenced by the faces, matching the
+    layout Open3D produces.
+
+    Args:
+        output_path: Destination ``.obj`` path.
+        mesh: The mesh to write.
+    """
+    vertices = np.asarray(mesh.vertices)
+    triangles = np.asarray(mesh.triangles) + 1
+    parts = [
+        "# Created by ObjectFingerprint\n",
+        f"# number of vertices: {len(vertices)}\n",
+        f"# number of triangles: {len(triangles)}\n",
+    ]
+    if mesh.has_vertex_colors():
+        parts.append(_format_rows(
+            "v %.9g %.9g %.9g %.6f %.6f %.6f\n",
+            np.hstack((vertices, np.asarray(mesh.vertex_colors))),
+        ))
+    else:
+        parts.append(_format_rows("v %.9g %.9g %.9g\n", vertices))
+    if mesh.has_vertex_normals():
+        parts.append(_format_rows(
+            "vn %.9g %.9g %.9g\n", np.asarray(mesh.vertex_normals)
+        ))
+        parts.append(_format_rows(
+            "f %d//%d %d//%d %d//%d\n", np.repeat(triangles, 2, axis=1)
+        ))
+    else:
+        parts.append(_format_rows("f %d %d %d\n", triangles))
+    output_path.write_bytes("".join(parts).encode("ascii"))
+
+
+def _write_compact_ply(output_path: Path, mesh: o3d.geometry.TriangleMesh) -> None:
+    """Write a mesh as a compact binary little-endian PLY.
+
+    Positions are stored as float32 and colors as uchar, without vertex
+    normals: 15 bytes per colored vertex versus 51 for Open3D's double
+    precision layout with normals.
+
+    Args:
+        output_path: Destination ``.ply`` path.
+        mesh: The mesh to write.
+    """
+    vertices = np.asarray(mesh.vertices)
+    triangles = np.asarray(mesh.triangles)
+    has_colors = mesh.has_vertex_colors()
+
+    vertex_fields = [("x", "<f4"), ("y", "<f4"), ("z", "<f4")]
+    if has_colors:
+        vertex_fields += [("red", "u1"), ("green", "u1"), ("blue", "u1")]
+    vertex_data = np.empty(len(vertices), dtype=vertex_fields)
+    vertex_data["x"], vertex_data["y"], vertex_data["z"] = vertices.T
+    if has_colors:
+        colors = np.rint(np.asarray(mesh.vertex_colors) * 255.0).astype(np.uint8)
+        vertex_data["red"], vertex_data["green"], vertex_data["blue"] = colors.T
+
+    face_data = np.empty(
+        len(triangles), dtype=[("count", "u1"), ("indices", "<i4", (3,))]
+    )
+    face_data["count"] = 3
+    face_data["indices"] = triangles
+
+    header = [
+        "ply",
+        "format binary_little_endian 1.0",
+        "comment Created by ObjectFingerprint",
+        f"element vertex {len(vertices)}",
+        "property float x",
+        "property float y",
+        "property float z",
+    ]
+    if has_colors:
+        header += ["property uchar red", "property uchar green", "property uchar blue"]
+    header += [
+        f"element face {len(triangles)}",
+        "property list uchar int vertex_indices",
+        "end_header",
+    ]
+    output_path.write_bytes(
+        ("\n".join(header) + "\n").encode("ascii")
+        + vertex_data.tobytes()
+        + face_data.tobytes()
+    )
 
 
 class ObjectGenerator:
@@ -72,42 +277,163 @@ class ObjectGenerator:
             shape, size, color,
         )
 
-    def generate(self) -> o3d.geometry.TriangleMesh:
+    def generate(
+        self, vertex_normals: bool = True, vertex_colors: bool = True
+    ) -> o3d.geometry.TriangleMesh:
         """Generate the 3D mesh based on the configured parameters.
 
+        Args:
+            vertex_normals: Compute vertex normals for shading. Pass False
+                when the mesh is only exported as STL, which stores face
+                normals alone; they are then computed on demand by export
+                or rendering.
+            vertex_colors: Paint the configured color onto the vertices.
+                Pass False when the colors are never used (STL export
+                without rendering).
+
         Returns:
             The generated Open3D triangle mesh.
         """
         logger.info("Generating %s with size=%s", self.shape, self.size)
 
-        if self.shape == "sphere":
-            self._mesh = o3d.geometry.TriangleMesh.create_sphere(
-                radius=self.size, resolution=self.resolution
-            )
-        elif self.shape == "cube":
-            self._mesh = o3d.geometry.TriangleMesh.create_box(
-                width=self.size, height=self.size, depth=self.size
-            )
-            # Center the cube at origin
-            self._mesh.translate(-np.array([self.size, self.size, self.size]) / 2.0)
-        elif self.shape == "cylinder":
-            self._mesh = o3d.geometry.TriangleMesh.create_cylinder(
-                radius=self.size / 2.0,
-                height=self.size,
-                resolution=self.resolution,
-            )
-
-        self._mesh.compute_vertex_normals()
-        self._apply_color()
+        base = _build_base_mesh(
+            self.shape, self.size, self.resolution, vertex_normals
+        )
+        # Copy the shared template so per-instance color never leaks into the cache
+        self._mesh = o3d.geometry.TriangleMesh(base)
+        if vertex_colors:
+            self._apply_color()
         logger.info("Generated %s with %d vertices", self.shape, len(self._mesh.vertices))
         return self._mesh
 
+    @classmethod
+    def build_batch(
+        cls, specs: List[Dict[str, Any]]
+    ) -> List[o3d.geometry.TriangleMesh]:
+        """Generate many meshes, building each distinct geometry only once.
+
+        Specs are grouped by (shape, size, resolution) so every base mesh is
+        tessellated once; each spec then only copies and colors its template.
+
+        Args:
+            specs: Keyword arguments for ``ObjectGenerator``, one dict per
+                object (e.g. ``{"shape": "cube", "color": (0, 255, 0)}``).
+
+        Returns:
+            The generated meshes, in the same order as ``specs``.
+
+        Raises:
+            ValueError: If any spec has invalid parameters.
+        """
+        generators = [cls(**spec) for spec in specs]
+        if not generators:
+            return []
+        groups = {(g.shape, g.size, g.resolution) for g in generators}
+        for key in groups:
+            _build_base_mesh(*key, True)
+        logger.info(
+            "Building batch of %d objects from %d base meshes",
+            len(generators), len(groups),
+        )
+        return [generator.generate() for generator in generators]
+
+    def build_instanced(
+        self,
+        translations: Sequence[Sequence[float]],
+        colors: Optional[Sequence[Tuple[int, int, int]]] = None,
+    ) -> o3d.geometry.TriangleMesh:
+        """Merge many translated copies of the configured shape into one mesh.
+
+        The base geometry is tiled into a single vertex/triangle buffer, so
+        K instances cost one Open3D mesh (and one exported file) instead of K.
+        The merged mesh becomes this generator's mesh for ``export()``.
+
+        Args:
+            translations: Per-instance (x, y, z) offsets, shape (K, 3).
+            colors: Optional per-instance RGB colors with values in [0, 255];
+                defaults to the generator's color for every instance.
+
+        Returns:
+            The merged Open3D triangle mesh.
+
+        Raises:
+            ValueError: If translations or colors have the wrong shape, or
+                color values are out of range.
+        """
+        offsets = np.asarray(translations, dtype=np.float64)
+        if offsets.ndim != 2 or offsets.shape[1] != 3 or len(offsets) == 0:
+            raise ValueError(
+                f"Translations must have shape (K, 3) with K > 0, got {offsets.shape}."
+            )
+        count = len(offsets)
+        if colors is None:
+            color_norm = np.broadcast_to(self._normalized_color(), (count, 3))
+        else:
+            color_arr = np.asarray(colors)
+            if color_arr.shape != (count, 3):
+                raise ValueError(
+                    f"Colors must have shape ({count}, 3), got {color_arr.shape}."
+                )
+            if np.any((color_arr < 0) | (color_arr > 255)):
+                raise ValueError("Color values must be in [0, 255].")
+            color_norm = color_arr.astype(np.float64) * (1.0 / 255.0)
+
+        base = _build_base_mesh(self.shape, self.size, self.resolution, True)
+        vertices = np.asarray(base.vertices)
+        triangles = np.asarray(base.triangles)
+        n_verts = len(vertices)
+
+        all_vertices = (
+            vertices[np.newaxis, :, :] + offsets[:, np.newaxis, :]
+        ).reshape(-1, 3)
+        all_triangles = (
+            triangles[np.newaxis, :, :]
+            + (np.arange(count, dtype=np.int32) * n_verts)[:, np.newaxis, np.newaxis]
+        ).reshape(-1, 3)
+        all_normals = np.tile(np.asarray(base.vertex_normals), (count, 1))
+        all_colors = np.repeat(color_norm, n_verts, axis=0)
+
+        mesh = o3d.geometry.TriangleMesh(
+            o3d.utility.Vector3dVector(all_vertices),
+            o3d.utility.Vector3iVector(all_triangles.astype(np.int32)),
+        )
+        mesh.vertex_normals = o3d.utility.Vector3dVector(all_normals)
+        mesh.vertex_colors = o3d.utility.Vector3dVector(all_colors)
+        self._mesh = mesh
+        logger.info(
+            "Built %d instanced %s meshes with %d vertices",
+            count, self.shape, len(all_vertices),
+        )
+        return mesh
+
+    def _ensure_normals(self, kind: str) -> None:
+        """Compute the normals a consumer needs if the mesh lacks them.
+
+        Args:
+            kind: 'vertex' for shading and PLY/OBJ output, 'triangle' for
+                STL output, or 'none'.
+        """
+        if self._mesh is None or kind == "none":
+            return
+        if kind == "vertex" and not self._mesh.has_vertex_normals():
+            self._mesh.compute_vertex_normals()
+        elif kind == "triangle" and not self._mesh.has_triangle_normals():
+            self._mesh.compute_triangle_normals()
+
+    def _normalized_color(self) -> np.ndarray:
+        """Return the current color as normalized RGB (0.0-1.0)."""
+        return np.asarray(self.color, dtype=np.float64) * (1.0 / 255.0)
+
     def _apply_color(self) -> None:
         """Apply uniform RGB color to all vertices."""
         if self._mesh is None:
             return
-        color_normalized = np.array(self.color) / 255.0
-        self._mesh.paint_uniform_color(color_normalized)
+        num_vertices = len(self._mesh.vertices)
+        colors = np.broadcast_to(self._normalized_color(), (num_vertices, 3))
+        # Vector3dVector binds a contiguous float64 (N, 3) buffer directly
+        self._mesh.vertex_colors = o3d.utility.Vector3dVector(
+            np.ascontiguousarray(colors)
+        )
         logger.debug("Applied color %s to mesh", self.color)
 
     def get_mesh(self) -> Optional[o3d.geometry.TriangleMesh]:
@@ -120,26 +446,34 @@ class ObjectGenerator:
 
     def export(
         self,
-        filepath: str,
+        filepath: Union[str, os.PathLike],
         file_format: str = "ply",
+        compact: bool = False,
     ) -> str:
         """Export the generated mesh to a file.
 
         Args:
             filepath: Output file path (without extension).
             file_format: Export format - one of 'ply', 'obj', 'stl'.
+            compact: Write PLY with float32 positions and uchar colors and
+                no normals, for very large (e.g. instanced) meshes.
 
         Returns:
             The full path of the exported file.
 
         Raises:
-            ValueError: If format is unsupported.
+            ValueError: If format is unsupported, or compact is requested
+                for a format other than PLY.
             RuntimeError: If no mesh has been generated yet.
         """
         if file_format not in SUPPORTED_FORMATS:
             raise ValueError(
                 f"Unsupported format '{file_format}'. Must be one of {SUPPORTED_FORMATS}."
             )
+        if compact and file_format != "ply":
+            raise ValueError(
+                f"Compact export is only supported for 'ply', got '{file_format}'."
+            )
         if self._mesh is None:
             raise RuntimeError(
                 "No mesh generated. Call generate() first."
@@ -147,7 +481,28 @@ class ObjectGenerator:
 
         output_path = Path(filepath).with_suffix(f".{file_format}")
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        o3d.io.write_triangle_mesh(str(output_path), self._mesh)
+        if file_format == "stl":
+            self._ensure_normals("triangle")
+        elif not compact:
+            self._ensure_normals("vertex")
+        if file_format == "obj" or compact:
+            writer = _write_obj if file_format == "obj" else _write_compact_ply
+            writer(output_path, self._mesh)
+            logger.info("Exported mesh to %s", output_path)
+            return str(output_path)
+
+        written = o3d.io.write_triangle_mesh(
+            str(output_path),
+            self._mesh,
+            write_ascii=False,
+            compressed=True,
+            write_vertex_normals=True,
+            write_vertex_colors=True,
+            write_triangle_uvs=False,
+            print_progress=False,
+        )
+        if not written:
+            raise RuntimeError(f"Failed to write mesh to {output_path}.")
         logger.info("Exported mesh to %s", output_path)
         return str(output_path)
 
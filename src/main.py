@@ -8,17 +8,24 @@ Usage:
 """
 
 import argparse
+import functools
 import logging
+import re
 import sys
 from pathlib import Path
 from typing import Optional, Tuple
 
 from src import __version__
-from src.generator import ObjectGenerator, SUPPORTED_SHAPES, SUPPORTED_FORMATS
-from src.provenance import ProvenanceTracker
-from src.renderer import MeshRenderer
+from src.constants import (
+    SUPPORTED_FORMATS,
+    SUPPORTED_IMAGE_FORMATS,
+    SUPPORTED_SHAPES,
+)
 
+_COLOR_RE = re.compile(r"\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*")
 
+
+@functools.lru_cache(maxsize=256)
 def parse_color(color_str: str) -> Tuple[int, int, int]:
     """Parse a comma-separated RGB color string.
 
@@ -31,22 +38,28 @@ def parse_color(color_str: str) -> Tuple[int, int, int]:
     Raises:
         argparse.ArgumentTypeError: If the format is invalid.
     """
-    try:
-        parts = [int(c.strip()) for c in color_str.split(",")]
-        if len(parts) != 3:
-            raise ValueError("Expected 3 values")
-        if not all(0 <= c <= 255 for c in parts):
-            raise ValueError("Values must be in [0, 255]")
-        return (parts[0], parts[1], parts[2])
-    except (ValueError, TypeError) as exc:
+    match = _COLOR_RE.fullmatch(color_str)
+    if match is None:
+        raise argparse.ArgumentTypeError(
+            f"Invalid color '{color_str}'. Use format 'R,G,B' (e.g., '255,0,0'): "
+            "expected three comma-separated integers"
+        )
+    r, g, b = int(match[1]), int(match[2]), int(match[3])
+    if (r | g | b) & ~0xFF:
         raise argparse.ArgumentTypeError(
-            f"Invalid color '{color_str}'. Use format 'R,G,B' (e.g., '255,0,0'): {exc}"
+            f"Invalid color '{color_str}'. Use format 'R,G,B' (e.g., '255,0,0'): "
+            "values must be in [0, 255]"
         )
+    return (r, g, b)
 
 
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
     """Build and return the argument parser.
 
+    The parser is built once and shared between calls; it holds no
+    per-parse state, but callers must not add arguments to it.
+
     Returns:
         Configured ArgumentParser instance.
     """
@@ -110,6 +123,13 @@ def build_parser() -> argparse.ArgumentParser:
         default=600,
         help="Rendered image height in pixels (default: 600)",
     )
+    parser.add_argument(
+        "--image-format",
+        type=str,
+        choices=SUPPORTED_IMAGE_FORMATS,
+        default="png",
+        help="Rendered image format (default: png)",
+    )
     parser.add_argument(
         "--no-render",
         action="store_true",
@@ -147,6 +167,10 @@ def main(argv: Optional[list] = None) -> int:
     )
     logger = logging.getLogger(__name__)
 
+    # Deferred so that --help/--version and argument errors never load Open3D
+    from src.generator import ObjectGenerator
+    from src.provenance import ProvenanceTracker
+
     try:
         output_dir = Path(args.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -159,9 +183,15 @@ def main(argv: Optional[list] = None) -> int:
             color=args.color,
             resolution=args.resolution,
         )
-        mesh = generator.generate()
+        # STL stores face normals only and no colors, so per-vertex
+        # normals and colors are needed just for other formats or rendering
+        needs_vertex_data = args.format != "stl" or not args.no_render
+        mesh = generator.generate(
+            vertex_normals=needs_vertex_data,
+            vertex_colors=needs_vertex_data,
+        )
         model_path = generator.export(
-            str(output_dir / base_name), file_format=args.format
+            output_dir / base_name, file_format=args.format
         )
         logger.info("3D model saved to: %s", model_path)
 
@@ -182,18 +212,22 @@ def main(argv: Optional[list] = None) -> int:
 
         # Render to image
         if not args.no_render:
+            # Only rendering needs Open3D's Filament-backed rendering module
+            from src.renderer import MeshRenderer
+
             renderer = MeshRenderer(
                 width=args.render_width,
                 height=args.render_height,
             )
             image_path = renderer.render_to_image(
-                mesh, str(output_dir / base_name)
+                mesh, output_dir / base_name, image_format=args.image_format
             )
             logger.info("Rendered image saved to: %s", image_path)
 
             tracker.record_entity(
                 "rendered_image", "RenderedImage", image_path,
                 attributes={
+                    "format": args.image_format,
                     "width": str(args.render_width),
                     "height": str(args.render_height),
                 },
@@ -203,7 +237,7 @@ def main(argv: Optional[list] = None) -> int:
             tracker.record_derivation("rendered_image", "model_3d")
 
         # Export provenance
-        prov_json_path = tracker.export_json(str(output_dir / f"{base_name}_provenance"))
+        prov_json_path = tracker.export_json(output_dir / f"{base_name}_provenance")
         logger.info("Provenance JSON saved to: %s", prov_json_path)
 
         print(f"Successfully generated {args.shape}:")
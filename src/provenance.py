@@ -5,11 +5,11 @@ of 3D models and rendered images, including entities, activities, agents,
 timestamps, and generation parameters. Supports export to PROV-JSON and PROV-XML.
 """
 
-import json
 import logging
+import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
 from prov.model import ProvDocument, Namespace, PROV_TYPE
 
@@ -81,6 +81,41 @@ class ProvenanceTracker:
             filepath: File path where the entity is stored.
             attributes: Additional attributes to record.
         """
+        self.doc.entity(
+            self._ns[entity_id],
+            self._entity_attributes(entity_id, entity_type, filepath, attributes),
+        )
+        logger.info("Recorded entity: %s (%s)", entity_id, entity_type)
+
+    def record_entities(
+        self,
+        entities: Iterable[
+            Tuple[str, str, str, Optional[Dict[str, str]]]
+        ],
+    ) -> None:
+        """Record several entities in one call.
+
+        Args:
+            entities: (entity_id, entity_type, filepath, attributes) tuples,
+                with the same meaning as the arguments of ``record_entity``.
+        """
+        count = 0
+        for entity_id, entity_type, filepath, attributes in entities:
+            self.doc.entity(
+                self._ns[entity_id],
+                self._entity_attributes(entity_id, entity_type, filepath, attributes),
+            )
+            count += 1
+        logger.info("Recorded %d entities", count)
+
+    def _entity_attributes(
+        self,
+        entity_id: str,
+        entity_type: str,
+        filepath: str,
+        attributes: Optional[Dict[str, str]],
+    ) -> Dict[Any, Any]:
+        """Build the PROV attribute dictionary for an entity."""
         attrs: Dict[Any, Any] = {
             PROV_TYPE: self._ns[entity_type],
             "prov:label": entity_id,
@@ -89,9 +124,7 @@ class ProvenanceTracker:
         if attributes:
             for key, value in attributes.items():
                 attrs[self._ns[key]] = value
-
-        self.doc.entity(self._ns[entity_id], attrs)
-        logger.info("Recorded entity: %s (%s)", entity_id, entity_type)
+        return attrs
 
     def record_agent(
         self,
@@ -133,6 +166,23 @@ class ProvenanceTracker:
         )
         logger.debug("Recorded generation: %s by %s", entity_id, activity_id)
 
+    def record_generations(
+        self, entity_ids: Iterable[str], activity_id: str
+    ) -> None:
+        """Record that several entities were generated by one activity.
+
+        All generations share a single end timestamp.
+
+        Args:
+            entity_ids: Identifiers of the generated entities.
+            activity_id: Identifier of the generating activity.
+        """
+        self._end_time = datetime.now(timezone.utc)
+        activity = self._ns[activity_id]
+        for entity_id in entity_ids:
+            self.doc.wasGeneratedBy(self._ns[entity_id], activity, self._end_time)
+        logger.debug("Recorded generations by %s", activity_id)
+
     def record_attribution(self, entity_id: str, agent_id: str) -> None:
         """Record that an entity was attributed to an agent.
 
@@ -143,6 +193,20 @@ class ProvenanceTracker:
         self.doc.wasAttributedTo(self._ns[entity_id], self._ns[agent_id])
         logger.debug("Recorded attribution: %s to %s", entity_id, agent_id)
 
+    def record_attributions(
+        self, entity_ids: Iterable[str], agent_id: str
+    ) -> None:
+        """Record that several entities were attributed to one agent.
+
+        Args:
+            entity_ids: Identifiers of the entities.
+            agent_id: Identifier of the agent.
+        """
+        agent = self._ns[agent_id]
+        for entity_id in entity_ids:
+            self.doc.wasAttributedTo(self._ns[entity_id], agent)
+        logger.debug("Recorded attributions to %s", agent_id)
+
     def record_derivation(
         self, derived_id: str, source_id: str
     ) -> None:
@@ -155,7 +219,7 @@ class ProvenanceTracker:
         self.doc.wasDerivedFrom(self._ns[derived_id], self._ns[source_id])
         logger.debug("Recorded derivation: %s from %s", derived_id, source_id)
 
-    def export_json(self, filepath: str) -> str:
+    def export_json(self, filepath: Union[str, os.PathLike]) -> str:
         """Export the provenance document as PROV-JSON.
 
         Args:
@@ -167,15 +231,14 @@ class ProvenanceTracker:
         output_path = Path(filepath).with_suffix(".json")
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        prov_json = self.doc.serialize(format="json")
-        parsed = json.loads(prov_json)
-        output_path.write_text(
-            json.dumps(parsed, indent=2, default=str), encoding="utf-8"
-        )
+        # Stream straight into the file instead of serializing to a string,
+        # parsing it back, and dumping it again just to indent it
+        with output_path.open("w", encoding="utf-8") as stream:
+            self.doc.serialize(stream, format="json", indent=2)
         logger.info("Exported provenance JSON to %s", output_path)
         return str(output_path)
 
-    def export_xml(self, filepath: str) -> str:
+    def export_xml(self, filepath: Union[str, os.PathLike]) -> str:
         """Export the provenance document as PROV-XML.
 
         Args:
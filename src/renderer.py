@@ -1,18 +1,36 @@
 """3D to 2D image rendering module.
 
 Renders Open3D 3D meshes to 2D images with configurable camera position,
-lighting, and resolution. Supports saving as PNG.
+lighting, and resolution. Supports saving as PNG or JPEG.
 """
 
 import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import open3d as o3d
 
+from src.constants import SUPPORTED_IMAGE_FORMATS
+
 logger = logging.getLogger(__name__)
 
+_SUN_DIRECTION = np.array([0.577, -0.577, -0.577], dtype=np.float32)
+_SUN_COLOR = np.array([1.0, 1.0, 1.0], dtype=np.float32)
+_SUN_INTENSITY = 100000
+
+
+def _write_image(
+    output_path: Path, image: o3d.geometry.Image, quality: int
+) -> None:
+    """Encode and write a rendered image, raising if Open3D reports failure."""
+    if not o3d.io.write_image(str(output_path), image, quality):
+        raise RuntimeError(f"Failed to write image to {output_path}.")
+    logger.info("Rendered image saved to %s", output_path)
+
 
 class MeshRenderer:
     """Renders Open3D meshes to 2D images using offscreen rendering.
@@ -54,6 +72,17 @@ class MeshRenderer:
         self.camera_position = camera_position
         self.look_at = look_at
         self.up_vector = up_vector
+        self._renderer: Optional[o3d.visualization.rendering.OffscreenRenderer] = None
+        self._renderer_size: Optional[Tuple[int, int]] = None
+        self._camera: Optional[Tuple[tuple, tuple, tuple]] = None
+        self._background: Optional[Tuple[float, float, float]] = None
+        self._material = o3d.visualization.rendering.MaterialRecord()
+        self._material.shader = "defaultLit"
+        # Image encoding and disk writes overlap with the next render
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        # Filament contexts are not reentrant; also guards the write queue
+        self._lock = threading.Lock()
         logger.info(
             "MeshRenderer initialized: %dx%d, camera=%s",
             width, height, camera_position,
@@ -62,10 +91,13 @@ class MeshRenderer:
     def render_to_image(
         self,
         mesh: o3d.geometry.TriangleMesh,
-        filepath: str,
+        filepath: Union[str, os.PathLike],
         background_color: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+        image_format: str = "png",
+        quality: int = 90,
+        wait: bool = True,
     ) -> str:
-        """Render a mesh to a PNG image file.
+        """Render a mesh to an image file.
 
         Uses Open3D's offscreen rendering to produce a 2D image of the mesh.
 
@@ -73,40 +105,147 @@ class MeshRenderer:
             mesh: The Open3D triangle mesh to render.
             filepath: Output file path (without extension).
             background_color: Background color as normalized RGB (0.0-1.0).
+            image_format: Image format - 'png' (lossless) or 'jpg' (much
+                faster to encode and smaller on disk).
+            quality: JPEG quality in [1, 100]; ignored for PNG.
+            wait: Block until the image file is written. With False the
+                encode and write run in the background so the next render
+                can start; call ``flush()`` before using the file.
 
         Returns:
-            The full path of the saved PNG file.
+            The full path of the saved image file.
+
+        Raises:
+            ValueError: If the image format is unsupported.
+            RuntimeError: If the image file could not be written.
         """
-        output_path = Path(filepath).with_suffix(".png")
+        if image_format not in SUPPORTED_IMAGE_FORMATS:
+            raise ValueError(
+                f"Unsupported image format '{image_format}'. "
+                f"Must be one of {SUPPORTED_IMAGE_FORMATS}."
+            )
+        output_path = Path(filepath).with_suffix(f".{image_format}")
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        renderer = o3d.visualization.rendering.OffscreenRenderer(
-            self.width, self.height
-        )
-        renderer.scene.set_background(
-            np.array([*background_color, 1.0])
-        )
+        # Tensor geometry is uploaded to Filament's GPU buffers directly from
+        # contiguous float32 arrays instead of the per-vertex legacy path
+        tmesh = o3d.t.geometry.TriangleMesh.from_legacy(mesh)
+        if "normals" not in tmesh.vertex:
+            # defaultLit shading needs vertex normals; computing them on the
+            # tensor copy leaves the caller's mesh untouched
+            tmesh.compute_vertex_normals()
 
-        material = o3d.visualization.rendering.MaterialRecord()
-        material.shader = "defaultLit"
-        renderer.scene.add_geometry("mesh", mesh, material)
+        with self._lock:
+            renderer = self._get_renderer()
+            renderer.scene.clear_geometry()
+            self._update_camera(renderer)
+            background = tuple(background_color)
+            if background != self._background:
+                renderer.scene.set_background(
+                    np.array([*background, 1.0], dtype=np.float32)
+                )
+                self._background = background
+            renderer.scene.add_geometry(
+                "mesh",
+                tmesh,
+                self._material,
+                add_downsampled_copy_for_fast_rendering=False,
+            )
 
-        renderer.scene.scene.set_sun_light(
-            [0.577, -0.577, -0.577], [1.0, 1.0, 1.0], 100000
-        )
+            img = renderer.render_to_image()
+
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(max_workers=2)
+            future = self._io_pool.submit(
+                _write_image, output_path, img, quality if image_format == "jpg" else -1
+            )
+            if not wait:
+                self._pending.append(future)
+        if wait:
+            future.result()
+        return str(output_path)
+
+    def flush(self) -> None:
+        """Wait for all background image writes to finish.
+
+        Raises:
+            RuntimeError: If any pending image could not be written.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def _get_renderer(self) -> o3d.visualization.rendering.OffscreenRenderer:
+        """Return the offscreen renderer, creating it on first use.
+
+        Building an OffscreenRenderer compiles shaders and allocates GPU
+        framebuffers, so one instance (with its light and camera) is reused
+        across render_to_image calls. It is rebuilt when ``width`` or
+        ``height`` has changed since it was created.
+
+        Returns:
+            The cached offscreen renderer.
+        """
+        size = (self.width, self.height)
+        if self._renderer is None or self._renderer_size != size:
+            self._renderer = o3d.visualization.rendering.OffscreenRenderer(
+                self.width, self.height
+            )
+            self._renderer_size = size
+            self._background = None
+            self._camera = None
+            self._init_scene(self._renderer)
+            logger.debug("Created offscreen renderer %dx%d", self.width, self.height)
+        return self._renderer
+
+    def _init_scene(
+        self, renderer: o3d.visualization.rendering.OffscreenRenderer
+    ) -> None:
+        """Configure the lighting, which stays fixed across renders.
+
+        Args:
+            renderer: The freshly created offscreen renderer.
+        """
+        renderer.scene.scene.set_sun_light(_SUN_DIRECTION, _SUN_COLOR, _SUN_INTENSITY)
         renderer.scene.scene.enable_sun_light(True)
 
-        renderer.setup_camera(
-            60.0,
-            [*self.look_at],
-            [*self.camera_position],
-            [*self.up_vector],
+    def _update_camera(
+        self, renderer: o3d.visualization.rendering.OffscreenRenderer
+    ) -> None:
+        """Point the camera, skipping the call when its pose is unchanged.
+
+        Args:
+            renderer: The cached offscreen renderer.
+        """
+        camera = (
+            tuple(self.look_at), tuple(self.camera_position), tuple(self.up_vector)
         )
+        if camera != self._camera:
+            look_at, position, up_vector = camera
+            renderer.setup_camera(60.0, [*look_at], [*position], [*up_vector])
+            self._camera = camera
 
-        img = renderer.render_to_image()
-        o3d.io.write_image(str(output_path), img)
-        logger.info("Rendered image saved to %s", output_path)
-        return str(output_path)
+    def close(self) -> None:
+        """Finish pending writes and release the renderer and write pool.
+
+        Both are created again on the next render_to_image call.
+
+        Raises:
+            RuntimeError: If any pending image could not be written.
+        """
+        with self._lock:
+            self._renderer = None
+            io_pool, self._io_pool = self._io_pool, None
+        if io_pool is not None:
+            io_pool.shutdown(wait=True)
+        self.flush()
+
+    def __enter__(self) -> "MeshRenderer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def get_parameters(self) -> dict:
         """Return the rendering parameters as a dictionary.
@@ -3,16 +3,28 @@
 import argparse
 import json
 import os
+import shutil
+import subprocess
+import sys
 import tempfile
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import numpy as np
-
-from src.generator import ObjectGenerator, SUPPORTED_SHAPES, SUPPORTED_FORMATS
+import open3d as o3d
+
+from src.generator import (
+    ObjectGenerator,
+    SUPPORTED_SHAPES,
+    SUPPORTED_FORMATS,
+    _build_base_mesh,
+)
 from src.provenance import ProvenanceTracker
-from src.main import parse_color, build_parser
+from src.renderer import MeshRenderer
+from src.main import parse_color, build_parser, main
 
 
 class TestObjectGeneratorInit(unittest.TestCase):
@@ -82,12 +94,46 @@ class TestObjectGeneratorGenerate(unittest.TestCase):
         self.assertIsNotNone(mesh)
         self.assertGreater(len(mesh.vertices), 0)
 
+    def test_cube_centered_at_origin(self) -> None:
+        mesh = ObjectGenerator(shape="cube", size=2.0).generate()
+        vertices = np.asarray(mesh.vertices)
+        np.testing.assert_array_almost_equal(vertices.min(axis=0), [-1.0] * 3)
+        np.testing.assert_array_almost_equal(vertices.max(axis=0), [1.0] * 3)
+
     def test_generate_cylinder(self) -> None:
         gen = ObjectGenerator(shape="cylinder", size=1.0, resolution=10)
         mesh = gen.generate()
         self.assertIsNotNone(mesh)
         self.assertGreater(len(mesh.vertices), 0)
 
+    def test_cylinder_topology(self) -> None:
+        mesh = ObjectGenerator(shape="cylinder", size=2.0, resolution=12).generate()
+        self.assertEqual(len(mesh.vertices), 2 * 12 + 2)
+        self.assertEqual(len(mesh.triangles), 4 * 12)
+        self.assertTrue(mesh.is_watertight())
+        self.assertTrue(mesh.is_orientable())
+        vertices = np.asarray(mesh.vertices)
+        np.testing.assert_array_almost_equal(vertices.min(axis=0), [-1.0, -1.0, -1.0])
+        np.testing.assert_array_almost_equal(vertices.max(axis=0), [1.0, 1.0, 1.0])
+
+    def test_cylinder_normals_point_outward(self) -> None:
+        mesh = ObjectGenerator(shape="cylinder", resolution=16).generate()
+        mesh.compute_triangle_normals()
+        centers = np.asarray(mesh.vertices)[np.asarray(mesh.triangles)].mean(axis=1)
+        normals = np.asarray(mesh.triangle_normals)
+        self.assertTrue(np.all(np.einsum("ij,ij->i", centers, normals) > 0))
+
+    def test_generate_without_vertex_normals(self) -> None:
+        gen = ObjectGenerator(shape="cylinder", resolution=8)
+        mesh = gen.generate(vertex_normals=False)
+        self.assertFalse(mesh.has_vertex_normals())
+        self.assertTrue(mesh.has_triangle_normals())
+        self.assertTrue(gen.generate().has_vertex_normals())
+
+    def test_generate_without_vertex_colors(self) -> None:
+        mesh = ObjectGenerator(shape="cube").generate(vertex_colors=False)
+        self.assertFalse(mesh.has_vertex_colors())
+
     def test_mesh_has_colors(self) -> None:
         gen = ObjectGenerator(color=(255, 0, 0))
         mesh = gen.generate()
@@ -96,6 +142,19 @@ class TestObjectGeneratorGenerate(unittest.TestCase):
         self.assertEqual(colors.shape[1], 3)
         np.testing.assert_array_almost_equal(colors[0], [1.0, 0.0, 0.0])
 
+    def test_color_changed_after_init(self) -> None:
+        gen = ObjectGenerator(shape="cube", color=(255, 0, 0))
+        gen.color = (0, 0, 255)
+        mesh = gen.generate()
+        np.testing.assert_array_almost_equal(
+            np.asarray(mesh.vertex_colors)[0], [0.0, 0.0, 1.0]
+        )
+        instanced = gen.build_instanced([(0.0, 0.0, 0.0)])
+        np.testing.assert_array_almost_equal(
+            np.asarray(instanced.vertex_colors)[0], [0.0, 0.0, 1.0]
+        )
+        self.assertEqual(gen.get_parameters()["color"], [0, 0, 255])
+
     def test_get_mesh_before_generate(self) -> None:
         gen = ObjectGenerator()
         self.assertIsNone(gen.get_mesh())
@@ -105,6 +164,76 @@ class TestObjectGeneratorGenerate(unittest.TestCase):
         gen.generate()
         self.assertIsNotNone(gen.get_mesh())
 
+    def test_repeated_generate_reuses_base_mesh(self) -> None:
+        _build_base_mesh.cache_clear()
+        ObjectGenerator(shape="sphere", resolution=7).generate()
+        ObjectGenerator(shape="sphere", resolution=7).generate()
+        self.assertEqual(_build_base_mesh.cache_info().hits, 1)
+
+    def test_cached_mesh_colors_are_independent(self) -> None:
+        red = ObjectGenerator(shape="cube", color=(255, 0, 0)).generate()
+        blue = ObjectGenerator(shape="cube", color=(0, 0, 255)).generate()
+        np.testing.assert_array_almost_equal(
+            np.asarray(red.vertex_colors)[0], [1.0, 0.0, 0.0]
+        )
+        np.testing.assert_array_almost_equal(
+            np.asarray(blue.vertex_colors)[0], [0.0, 0.0, 1.0]
+        )
+
+    def test_generated_mesh_does_not_alias_cache(self) -> None:
+        mesh = ObjectGenerator(shape="sphere", resolution=9).generate()
+        np.asarray(mesh.vertices)[:] = 0.0
+        cached = _build_base_mesh("sphere", 1.0, 9, True)
+        self.assertGreater(np.abs(np.asarray(cached.vertices)).max(), 0.0)
+        self.assertFalse(cached.has_vertex_colors())
+
+    def test_build_batch_preserves_order(self) -> None:
+        specs = [
+            {"shape": "sphere", "color": (255, 0, 0), "resolution": 6},
+            {"shape": "cube", "color": (0, 255, 0)},
+            {"shape": "sphere", "color": (0, 0, 255), "resolution": 6},
+        ]
+        meshes = ObjectGenerator.build_batch(specs)
+        self.assertEqual(len(meshes), 3)
+        self.assertEqual(len(meshes[0].vertices), len(meshes[2].vertices))
+        self.assertEqual(len(meshes[1].vertices), 8)
+        for mesh, spec in zip(meshes, specs):
+            np.testing.assert_array_almost_equal(
+                np.asarray(mesh.vertex_colors)[0], np.array(spec["color"]) / 255.0
+            )
+
+    def test_build_batch_invalid_spec(self) -> None:
+        with self.assertRaises(ValueError):
+            ObjectGenerator.build_batch([{"shape": "pyramid"}])
+
+    def test_build_instanced(self) -> None:
+        gen = ObjectGenerator(shape="cube", size=1.0)
+        offsets = [(0.0, 0.0, 0.0), (5.0, 0.0, 0.0), (0.0, 5.0, 0.0)]
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        mesh = gen.build_instanced(offsets, colors)
+        self.assertIs(gen.get_mesh(), mesh)
+        self.assertEqual(len(mesh.vertices), 3 * 8)
+        self.assertEqual(len(mesh.triangles), 3 * 12)
+        vertices = np.asarray(mesh.vertices).reshape(3, 8, 3)
+        np.testing.assert_array_almost_equal(vertices[1].mean(axis=0), [5.0, 0.0, 0.0])
+        self.assertEqual(np.asarray(mesh.triangles).max(), 3 * 8 - 1)
+        vertex_colors = np.asarray(mesh.vertex_colors).reshape(3, 8, 3)
+        np.testing.assert_array_almost_equal(vertex_colors[2, 0], [0.0, 0.0, 1.0])
+
+    def test_build_instanced_default_color(self) -> None:
+        gen = ObjectGenerator(shape="sphere", color=(0, 255, 0), resolution=5)
+        mesh = gen.build_instanced([(0.0, 0.0, 0.0), (3.0, 0.0, 0.0)])
+        np.testing.assert_array_almost_equal(
+            np.unique(np.asarray(mesh.vertex_colors), axis=0), [[0.0, 1.0, 0.0]]
+        )
+
+    def test_build_instanced_invalid_translations(self) -> None:
+        gen = ObjectGenerator(shape="cube")
+        with self.assertRaises(ValueError):
+            gen.build_instanced([(0.0, 0.0)])
+        with self.assertRaises(ValueError):
+            gen.build_instanced([(0.0, 0.0, 0.0)], colors=[(0, 0, 0), (1, 1, 1)])
+
     def test_all_supported_shapes(self) -> None:
         for shape in SUPPORTED_SHAPES:
             gen = ObjectGenerator(shape=shape, resolution=5)
@@ -117,8 +246,15 @@ class TestObjectGeneratorGenerate(unittest.TestCase):
 class TestObjectGeneratorExport(unittest.TestCase):
     """Tests for ObjectGenerator export functionality."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+
     def setUp(self) -> None:
-        self.tmpdir = tempfile.mkdtemp()
         self.gen = ObjectGenerator(shape="sphere", resolution=5)
         self.gen.generate()
 
@@ -137,6 +273,98 @@ class TestObjectGeneratorExport(unittest.TestCase):
         self.assertTrue(path.endswith(".stl"))
         self.assertTrue(os.path.exists(path))
 
+    def test_export_obj_round_trip(self) -> None:
+        path = self.gen.export(os.path.join(self.tmpdir, "round_trip"), "obj")
+        loaded = o3d.io.read_triangle_mesh(path)
+        mesh = self.gen.get_mesh()
+        # The OBJ reader may reorder vertices, so compare per-triangle corners
+        loaded_tris = np.asarray(loaded.triangles)
+        mesh_tris = np.asarray(mesh.triangles)
+        np.testing.assert_array_almost_equal(
+            np.asarray(loaded.vertices)[loaded_tris],
+            np.asarray(mesh.vertices)[mesh_tris],
+            decimal=5,
+        )
+        np.testing.assert_array_almost_equal(
+            np.asarray(loaded.vertex_colors)[loaded_tris],
+            np.asarray(mesh.vertex_colors)[mesh_tris],
+        )
+
+    def test_export_obj_preserves_small_geometry(self) -> None:
+        gen = ObjectGenerator(shape="sphere", size=1e-6, resolution=5)
+        mesh = gen.generate()
+        path = gen.export(os.path.join(self.tmpdir, "tiny"), "obj")
+        loaded = o3d.io.read_triangle_mesh(path)
+        self.assertEqual(
+            len(np.unique(np.asarray(loaded.vertices), axis=0)),
+            len(mesh.vertices),
+        )
+        np.testing.assert_allclose(
+            np.asarray(loaded.vertices)[np.asarray(loaded.triangles)],
+            np.asarray(mesh.vertices)[np.asarray(mesh.triangles)],
+            rtol=1e-7,
+            atol=1e-15,
+        )
+
+    def test_export_accepts_pathlike(self) -> None:
+        path = self.gen.export(Path(self.tmpdir) / "pathlike", "stl")
+        self.assertIsInstance(path, str)
+        self.assertTrue(path.endswith("pathlike.stl"))
+        self.assertTrue(os.path.exists(path))
+
+    def test_export_compact_ply(self) -> None:
+        path = self.gen.export(os.path.join(self.tmpdir, "compact"), "ply", compact=True)
+        full = self.gen.export(os.path.join(self.tmpdir, "full"), "ply")
+        self.assertLess(os.path.getsize(path), os.path.getsize(full))
+        loaded = o3d.io.read_triangle_mesh(path)
+        mesh = self.gen.get_mesh()
+        np.testing.assert_array_almost_equal(
+            np.asarray(loaded.vertices), np.asarray(mesh.vertices), decimal=6
+        )
+        np.testing.assert_array_equal(
+            np.asarray(loaded.triangles), np.asarray(mesh.triangles)
+        )
+        np.testing.assert_array_almost_equal(
+            np.asarray(loaded.vertex_colors), np.asarray(mesh.vertex_colors)
+        )
+
+    def test_export_compact_requires_ply(self) -> None:
+        with self.assertRaises(ValueError):
+            self.gen.export(os.path.join(self.tmpdir, "test"), "stl", compact=True)
+
+    def test_export_stl_without_vertex_normals(self) -> None:
+        gen = ObjectGenerator(shape="cube")
+        gen.generate(vertex_normals=False)
+        path = gen.export(os.path.join(self.tmpdir, "faces"), "stl")
+        self.assertEqual(len(o3d.io.read_triangle_mesh(path).triangles), 12)
+        self.assertFalse(gen.get_mesh().has_vertex_normals())
+
+    def test_export_ply_computes_vertex_normals(self) -> None:
+        gen = ObjectGenerator(shape="cube")
+        gen.generate(vertex_normals=False)
+        path = gen.export(os.path.join(self.tmpdir, "shaded"), "ply")
+        self.assertTrue(o3d.io.read_triangle_mesh(path).has_vertex_normals())
+
+    def test_export_recreates_deleted_directory(self) -> None:
+        nested = os.path.join(self.tmpdir, "nested", "dir")
+        self.gen.export(os.path.join(nested, "first"), "ply")
+        shutil.rmtree(nested)
+        path = self.gen.export(os.path.join(nested, "second"), "ply")
+        self.assertTrue(os.path.exists(path))
+
+    def test_export_relative_path_after_chdir(self) -> None:
+        cwd = os.getcwd()
+        other = os.path.join(self.tmpdir, "other_cwd")
+        os.makedirs(other, exist_ok=True)
+        try:
+            os.chdir(self.tmpdir)
+            self.gen.export(os.path.join("rel", "a"), "ply")
+            os.chdir(other)
+            self.gen.export(os.path.join("rel", "b"), "ply")
+        finally:
+            os.chdir(cwd)
+        self.assertTrue(os.path.exists(os.path.join(other, "rel", "b.ply")))
+
     def test_export_invalid_format(self) -> None:
         with self.assertRaises(ValueError):
             self.gen.export(os.path.join(self.tmpdir, "test"), "fbx")
@@ -147,12 +375,185 @@ class TestObjectGeneratorExport(unittest.TestCase):
             gen.export(os.path.join(self.tmpdir, "test"))
 
 
+class TestMeshRenderer(unittest.TestCase):
+    """Tests for MeshRenderer (offscreen rendering is mocked)."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.mesh = ObjectGenerator(shape="cube").generate()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+
+    def test_invalid_dimensions(self) -> None:
+        with self.assertRaises(ValueError):
+            MeshRenderer(width=0, height=600)
+
+    @patch("src.renderer.o3d.io.write_image")
+    @patch("src.renderer.o3d.visualization.rendering.OffscreenRenderer")
+    def test_renderer_reused_across_renders(
+        self, mock_renderer_class: MagicMock, mock_write: MagicMock
+    ) -> None:
+        renderer = MeshRenderer(width=64, height=48)
+        first = renderer.render_to_image(self.mesh, os.path.join(self.tmpdir, "a"))
+        second = renderer.render_to_image(self.mesh, os.path.join(self.tmpdir, "b"))
+
+        self.assertTrue(first.endswith("a.png"))
+        self.assertTrue(second.endswith("b.png"))
+        mock_renderer_class.assert_called_once_with(64, 48)
+        offscreen = mock_renderer_class.return_value
+        offscreen.setup_camera.assert_called_once()
+        self.assertEqual(offscreen.scene.clear_geometry.call_count, 2)
+        first_call, second_call = offscreen.scene.add_geometry.call_args_list
+        self.assertIs(first_call.args[2], second_call.args[2])
+        offscreen.scene.set_background.assert_called_once()
+        self.assertEqual(mock_write.call_count, 2)
+
+        renderer.render_to_image(
+            self.mesh, os.path.join(self.tmpdir, "c"), background_color=(0.0, 0.0, 0.0)
+        )
+        self.assertEqual(offscreen.scene.set_background.call_count, 2)
+
+    @patch("src.renderer.o3d.io.write_image")
+    @patch("src.renderer.o3d.visualization.rendering.OffscreenRenderer")
+    def test_render_jpeg(
+        self, mock_renderer_class: MagicMock, mock_write: MagicMock
+    ) -> None:
+        renderer = MeshRenderer(width=64, height=48)
+        path = renderer.render_to_image(
+            self.mesh, os.path.join(self.tmpdir, "img"), image_format="jpg", quality=80
+        )
+        self.assertTrue(path.endswith("img.jpg"))
+        self.assertEqual(mock_write.call_args[0][2], 80)
+
+    @patch("src.renderer.o3d.io.write_image")
+    @patch("src.renderer.o3d.visualization.rendering.OffscreenRenderer")
+    def test_background_writes_flushed(
+        self, mock_renderer_class: MagicMock, mock_write: MagicMock
+    ) -> None:
+        renderer = MeshRenderer(width=64, height=48)
+        for name in ("a", "b", "c"):
+            renderer.render_to_image(
+                self.mesh, os.path.join(self.tmpdir, name), wait=False
+            )
+        renderer.flush()
+        self.assertEqual(mock_write.call_count, 3)
+
+    @patch("src.renderer.o3d.io.write_image", return_value=False)
+    @patch("src.renderer.o3d.visualization.rendering.OffscreenRenderer")
+    def test_failed_write_raises(
+        self, mock_renderer_class: MagicMock, mock_write: MagicMock
+    ) -> None:
+        renderer = MeshRenderer(width=64, height=48)
+        with self.assertRaises(RuntimeError):
+            renderer.render_to_image(self.mesh, os.path.join(self.tmpdir, "a"))
+        renderer.render_to_image(
+            self.mesh, os.path.join(self.tmpdir, "b"), wait=False
+        )
+        with self.assertRaises(RuntimeError):
+            renderer.flush()
+
+    @patch("src.renderer.o3d.io.write_image")
+    @patch("src.renderer.o3d.visualization.rendering.OffscreenRenderer")
+    def test_render_recreates_deleted_directory(
+        self, mock_renderer_class: MagicMock, mock_write: MagicMock
+    ) -> None:
+        mock_write.return_value = True
+        renderer = MeshRenderer(width=64, height=48)
+        frames = os.path.join(self.tmpdir, "frames")
+        renderer.render_to_image(self.mesh, os.path.join(frames, "a"))
+        shutil.rmtree(frames)
+        renderer.render_to_image(self.mesh, os.path.join(frames, "b"))
+        self.assertTrue(os.path.isdir(frames))
+
+    @patch("src.renderer.o3d.io.write_image")
+    @patch("src.renderer.o3d.visualization.rendering.OffscreenRenderer")
+    def test_renderer_rebuilt_after_resize(
+        self, mock_renderer_class: MagicMock, mock_write: MagicMock
+    ) -> None:
+        renderer = MeshRenderer(width=64, height=48)
+        renderer.render_to_image(self.mesh, os.path.join(self.tmpdir, "small"))
+        renderer.width, renderer.height = 128, 96
+        renderer.render_to_image(self.mesh, os.path.join(self.tmpdir, "large"))
+        self.assertEqual(
+            [c.args for c in mock_renderer_class.call_args_list],
+            [(64, 48), (128, 96)],
+        )
+
+    @patch("src.renderer.o3d.io.write_image")
+    @patch("src.renderer.o3d.visualization.rendering.OffscreenRenderer")
+    def test_camera_updated_after_attribute_change(
+        self, mock_renderer_class: MagicMock, mock_write: MagicMock
+    ) -> None:
+        renderer = MeshRenderer(width=64, height=48)
+        renderer.render_to_image(self.mesh, os.path.join(self.tmpdir, "front"))
+        renderer.camera_position = (0.0, 0.0, 5.0)
+        renderer.render_to_image(self.mesh, os.path.join(self.tmpdir, "side"))
+        renderer.render_to_image(self.mesh, os.path.join(self.tmpdir, "side2"))
+
+        offscreen = mock_renderer_class.return_value
+        self.assertEqual(offscreen.setup_camera.call_count, 2)
+        self.assertEqual(
+            offscreen.setup_camera.call_args.args[2], [0.0, 0.0, 5.0]
+        )
+
+    @patch("src.renderer.o3d.io.write_image")
+    @patch("src.renderer.o3d.visualization.rendering.OffscreenRenderer")
+    def test_render_does_not_modify_mesh(
+        self, mock_renderer_class: MagicMock, mock_write: MagicMock
+    ) -> None:
+        mesh = ObjectGenerator(shape="cube").generate(vertex_normals=False)
+        MeshRenderer(width=64, height=48).render_to_image(
+            mesh, os.path.join(self.tmpdir, "flat")
+        )
+        self.assertFalse(mesh.has_vertex_normals())
+        tmesh = mock_renderer_class.return_value.scene.add_geometry.call_args.args[1]
+        self.assertIn("normals", tmesh.vertex)
+
+    def test_render_invalid_image_format(self) -> None:
+        renderer = MeshRenderer(width=64, height=48)
+        with self.assertRaises(ValueError):
+            renderer.render_to_image(
+                self.mesh, os.path.join(self.tmpdir, "img"), image_format="bmp"
+            )
+
+    @patch("src.renderer.o3d.io.write_image")
+    @patch("src.renderer.o3d.visualization.rendering.OffscreenRenderer")
+    def test_close_releases_renderer(
+        self, mock_renderer_class: MagicMock, mock_write: MagicMock
+    ) -> None:
+        with patch.object(
+            ThreadPoolExecutor, "shutdown", autospec=True,
+            side_effect=ThreadPoolExecutor.shutdown,
+        ) as mock_shutdown:
+            with MeshRenderer(width=64, height=48) as renderer:
+                renderer.render_to_image(
+                    self.mesh, os.path.join(self.tmpdir, "a"), wait=False
+                )
+            mock_shutdown.assert_called_once()
+        mock_write.assert_called_once()
+        renderer.render_to_image(self.mesh, os.path.join(self.tmpdir, "b"))
+        self.assertEqual(mock_renderer_class.call_count, 2)
+        self.assertEqual(mock_write.call_count, 2)
+        renderer.close()
+
+
 class TestProvenanceTracker(unittest.TestCase):
     """Tests for ProvenanceTracker."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+
     def setUp(self) -> None:
+        # Trackers accumulate records, so each test gets a fresh one
         self.tracker = ProvenanceTracker("TestProject")
-        self.tmpdir = tempfile.mkdtemp()
 
     def test_record_activity(self) -> None:
         self.tracker.record_activity(
@@ -182,6 +583,23 @@ class TestProvenanceTracker(unittest.TestCase):
         records = list(doc.get_records())
         self.assertGreater(len(records), 2)
 
+    def test_record_entities_bulk(self) -> None:
+        self.tracker.record_activity("gen1", "Generate")
+        self.tracker.record_agent("sw", "TestSoftware", "1.0.0")
+        self.tracker.record_entities([
+            ("model", "3DModel", "/tmp/test.ply", {"format": "ply"}),
+            ("image", "RenderedImage", "/tmp/test.png", None),
+        ])
+        self.tracker.record_generations(["model", "image"], "gen1")
+        self.tracker.record_attributions(["model", "image"], "sw")
+
+        path = self.tracker.export_json(os.path.join(self.tmpdir, "bulk"))
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(set(data["entity"]), {"proj:model", "proj:image"})
+        self.assertEqual(len(data["wasGeneratedBy"]), 2)
+        self.assertEqual(len(data["wasAttributedTo"]), 2)
+
     def test_record_attribution(self) -> None:
         self.tracker.record_entity("model", "3DModel", "/tmp/test.ply")
         self.tracker.record_agent("sw", "TestSoftware", "1.0.0")
@@ -219,6 +637,17 @@ class TestProvenanceTracker(unittest.TestCase):
         self.assertTrue(path.endswith(".xml"))
         self.assertTrue(os.path.exists(path))
 
+    def test_export_recreates_deleted_directory(self) -> None:
+        self.tracker.record_activity("gen1", "Generate sphere")
+        out_dir = os.path.join(self.tmpdir, "prov_out")
+        self.tracker.export_json(os.path.join(out_dir, "prov"))
+        shutil.rmtree(out_dir)
+        json_path = self.tracker.export_json(os.path.join(out_dir, "prov"))
+        self.assertTrue(os.path.exists(json_path))
+        shutil.rmtree(out_dir)
+        xml_path = self.tracker.export_xml(os.path.join(out_dir, "prov"))
+        self.assertTrue(os.path.exists(xml_path))
+
 
 class TestParseColor(unittest.TestCase):
     """Tests for CLI color parsing."""
@@ -237,6 +666,19 @@ class TestParseColor(unittest.TestCase):
         with self.assertRaises(argparse.ArgumentTypeError):
             parse_color("256,0,0")
 
+    def test_invalid_color_negative(self) -> None:
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_color("-1,0,0")
+
+    def test_invalid_color_raises_on_every_call(self) -> None:
+        for _ in range(2):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                parse_color("300,0,0")
+
+    def test_invalid_color_too_many_values(self) -> None:
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_color("1,2,3,4")
+
     def test_invalid_color_text(self) -> None:
         with self.assertRaises(argparse.ArgumentTypeError):
             parse_color("red")
@@ -245,6 +687,18 @@ class TestParseColor(unittest.TestCase):
 class TestBuildParser(unittest.TestCase):
     """Tests for CLI argument parser."""
 
+    def test_cli_import_does_not_load_open3d(self) -> None:
+        code = (
+            "import sys; import src.main; "
+            "src.main.build_parser().parse_args([]); "
+            "sys.exit('open3d' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+        )
+        self.assertEqual(result.returncode, 0)
+
     def test_default_args(self) -> None:
         parser = build_parser()
         args = parser.parse_args([])
@@ -252,6 +706,9 @@ class TestBuildParser(unittest.TestCase):
         self.assertEqual(args.size, 1.0)
         self.assertEqual(args.format, "ply")
 
+    def test_parser_is_reused(self) -> None:
+        self.assertIs(build_parser(), build_parser())
+
     def test_custom_args(self) -> None:
         parser = build_parser()
         args = parser.parse_args([
@@ -268,5 +725,38 @@ class TestBuildParser(unittest.TestCase):
         self.assertTrue(args.no_render)
 
 
+class TestMain(unittest.TestCase):
+    """Tests for the CLI entry point."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+
+    @patch("src.renderer.MeshRenderer")
+    def test_model_generated_before_render(self, mock_renderer_class: MagicMock) -> None:
+        def slow_render(mesh, filepath, **kwargs) -> str:
+            time.sleep(0.01)
+            return str(Path(filepath).with_suffix(".png"))
+
+        mock_renderer_class.return_value.render_to_image.side_effect = slow_render
+        exit_code = main([
+            "--shape", "cube", "--resolution", "5", "--output-dir", self.tmpdir,
+        ])
+        self.assertEqual(exit_code, 0)
+
+        (prov_path,) = Path(self.tmpdir).glob("*.json")
+        with open(prov_path, encoding="utf-8") as f:
+            data = json.load(f)
+        times = {
+            record["prov:entity"]: record["prov:time"]
+            for record in data["wasGeneratedBy"].values()
+        }
+        self.assertLess(times["proj:model_3d"], times["proj:rendered_image"])
+
+
 if __name__ == "__main__":
     unittest.main()